@@ -1,7 +1,31 @@
+from functools import lru_cache
+
 import numpy as np
 from carculator_utils import get_standard_driving_cycle_and_gradient
 
 
+def _as_tuple(size) -> tuple:
+    """Make vehicle sizes hashable, a single size being passed as a string."""
+    return (size,) if isinstance(size, str) else tuple(size)
+
+
+@lru_cache(maxsize=8)
+def _get_driving_cycle_and_gradient(size: tuple, name: str) -> tuple:
+    """
+    Load driving cycle and road gradient data once
+    per combination of vehicle sizes and cycle name.
+
+    :param size: Tuple of vehicle sizes.
+    :param name: The name of the driving cycle.
+    :return: tuple of :meth:`ndarray` objects
+    """
+    return get_standard_driving_cycle_and_gradient(
+        vehicle_type="truck",
+        vehicle_sizes=list(size),
+        name=name,
+    )
+
+
 def get_driving_cycle(size: list, name: str) -> np.ndarray:
     """
     Get driving cycle.
@@ -10,11 +34,7 @@ def get_driving_cycle(size: list, name: str) -> np.ndarray:
     :param name: The name of the driving cycle.
     :return: :meth:`ndarray` object
     """
-    return get_standard_driving_cycle_and_gradient(
-        vehicle_type="truck",
-        vehicle_sizes=size,
-        name=name,
-    )[0]
+    return _get_driving_cycle_and_gradient(_as_tuple(size), name)[0].copy()
 
 
 def get_road_gradient(size: list, name: str) -> np.ndarray:
@@ -25,8 +45,4 @@ def get_road_gradient(size: list, name: str) -> np.ndarray:
     :param name: The name of the driving cycle.
     :return: :meth:`ndarray` object
     """
-    return get_standard_driving_cycle_and_gradient(
-        vehicle_type="truck",
-        vehicle_sizes=size,
-        name=name,
-    )[1]
+    return _get_driving_cycle_and_gradient(_as_tuple(size), name)[1].copy()
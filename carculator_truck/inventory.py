@@ -167,9 +167,9 @@ class InventoryTruck(Inventory):
             self.find_input_indices(contains=("maintenance, lorry 28 metric ton",)),
             [j for i, j in self.inputs.items() if i[0].startswith("truck, ")],
         ] = -1 * (
-            self.array.sel(parameter="gross mass")
-            * np.where(self.array.sel(parameter="gross mass") < 26000, 0, 1)
-            * np.where(self.array.sel(parameter="gross mass") >= 40000, 0, 1)
+            self.array.sel(parameter="gross mass").astype("float64")
+            * (self.array.sel(parameter="gross mass") >= 26000)
+            * (self.array.sel(parameter="gross mass") < 40000)
             / 1000
             / 28
         )
@@ -303,9 +303,9 @@ class InventoryTruck(Inventory):
             ),
             [j for i, j in self.inputs.items() if i[0].startswith("truck, ")],
         ] = -1 * (
-            self.array.sel(parameter="gross mass")
-            * np.where(self.array.sel(parameter="gross mass") < 26000, 0, 1)
-            * np.where(self.array.sel(parameter="gross mass") >= 40000, 0, 1)
+            self.array.sel(parameter="gross mass").astype("float64")
+            * (self.array.sel(parameter="gross mass") >= 26000)
+            * (self.array.sel(parameter="gross mass") < 40000)
             / 1000
             / 28
         )
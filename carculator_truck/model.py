@@ -25,7 +25,8 @@ def finite(array, mask_value=0):
 
 def _crf(i, n):
     # Capital Recovery Factor with i==0 → 1/n
-    return xr.where(i == 0, 1.0 / n, i * (1 + i) ** n / ((1 + i) ** n - 1))
+    q = (1 + i) ** n
+    return xr.where(i == 0, 1.0 / n, i * q / (q - 1))
 
 
 class TruckModel(VehicleModel):
@@ -39,6 +40,10 @@ class TruckModel(VehicleModel):
     :vartype mappings: dict
     :ivar ecm: instance of :class:`EnergyConsumptionModel` class for a given driving cycle
     :vartype ecm: coarse.energy_consumption.EnergyConsumptionModel
+    :ivar cycle_distance: distance covered over the driving cycle, in km, per size
+    :vartype cycle_distance: xarray.DataArray
+    :ivar cycle_hours_per_km: hours of operation per km driven over the driving cycle, per size
+    :vartype cycle_hours_per_km: xarray.DataArray
 
     """
 
@@ -76,6 +81,24 @@ class TruckModel(VehicleModel):
             powertrains=self.array.coords["powertrain"].values.tolist(),
         )
 
+        # distance covered over the driving cycle, in km.
+        # It does not change from one iteration to the next.
+        # A custom cycle is shared by all sizes, hence the broadcast.
+        self.cycle_distance = xr.DataArray(
+            np.broadcast_to(
+                self.ecm.velocity.sum(axis=0).reshape(-1) / 1000,
+                (len(self.array.coords["size"]),),
+            ),
+            dims=["size"],
+            coords={"size": self.array.coords["size"]},
+        )
+
+        # hours of operation, including idling, per km driven over the driving cycle
+        # (1 sec timestep), guarded against degenerate cycles
+        self.cycle_hours_per_km = (self.ecm.velocity.shape[0] / 3600.0) / xr.where(
+            self.cycle_distance > 0, self.cycle_distance, np.nan
+        )
+
         print("Finding solutions for trucks...")
 
         self.override_range()
@@ -316,7 +339,8 @@ class TruckModel(VehicleModel):
         if self.energy_consumption:
             self.override_ttw_energy()
 
-        distance = self.energy.sel(parameter="velocity").sum(dim="second") / 1000
+        # per-km normalisation, applied as a multiplication
+        inv_distance = 1 / self.cycle_distance
 
         # Correction for CNG trucks
         if "ICEV-g" in self.array.powertrain.values:
@@ -330,23 +354,21 @@ class TruckModel(VehicleModel):
                 )
             ).T.values
 
-        self["transmission efficiency"] = (
-            np.ma.array(
-                self.energy.loc[dict(parameter="transmission efficiency")],
-                mask=self.energy.loc[dict(parameter="power load")] == 0.0,
-            )
-            .mean(axis=0)
-            .T
-        )
+        # average efficiencies over the seconds the powertrain is loaded,
+        # both parameters sharing a single mask and a single reduction
+        efficiencies = self.energy.loc[
+            dict(parameter=["transmission efficiency", "engine efficiency"])
+        ].transpose("parameter", ...)
+        efficiencies = np.ma.array(
+            efficiencies,
+            mask=np.broadcast_to(
+                self.energy.loc[dict(parameter="power load")] == 0.0,
+                efficiencies.shape,
+            ),
+        ).mean(axis=1)
 
-        self["engine efficiency"] = (
-            np.ma.array(
-                self.energy.loc[dict(parameter="engine efficiency")],
-                mask=self.energy.loc[dict(parameter="power load")] == 0.0,
-            )
-            .mean(axis=0)
-            .T
-        )
+        self["transmission efficiency"] = efficiencies[0].T
+        self["engine efficiency"] = efficiencies[1].T
 
         self["TtW energy"] = (
             self.energy.sel(
@@ -355,7 +377,7 @@ class TruckModel(VehicleModel):
                     "auxiliary energy",
                 ]
             ).sum(dim=["second", "parameter"])
-            / distance
+            * inv_distance
         ).T
 
         # saved_TtW_energy_by_recuperation = recuperated energy
@@ -365,7 +387,7 @@ class TruckModel(VehicleModel):
         self["TtW energy"] += (
             (
                 self.energy.sel(parameter="recuperated energy").sum(dim="second")
-                / distance
+                * inv_distance
             ).T
             * self.array.sel(parameter="engine efficiency")
             * self.array.sel(parameter="transmission efficiency")
@@ -389,7 +411,7 @@ class TruckModel(VehicleModel):
 
         self["auxiliary energy"] = (
             self.energy.sel(parameter="auxiliary energy").sum(dim="second").values
-            / distance.values
+            * inv_distance.values
         ).T
 
     def set_battery_fuel_cell_replacements(self):
@@ -427,31 +449,16 @@ class TruckModel(VehicleModel):
         # The number of replacement is rounded *up* as we assume
         # no allocation of burden with a second life
 
-        # 1) Pull velocity (m/s) over the whole drive cycle; include zeros for stops.
-        vel = self.energy.sel(parameter="velocity")
-        vel = vel.fillna(0)
-
-        if "value" in vel.dims and vel.sizes["value"] == 1:
-            vel = vel.squeeze("value", drop=True)
-
-        # 2) Duration of the representative cycle in hours (1 sec timestep assumed by your coords).
-        duration_h = vel.sizes["second"] / 3600.0
-
-        # 3) Distance covered by the representative cycle in km (∑ v*dt, with dt=1 s).
-        duty_km = vel.sum(dim="second") / 1000.0
+        # 1) Convert lifetime kilometers → required stack operating hours, including idle:
+        #    lifetime_hours_required = lifetime_km * (cycle duration / cycle distance)
+        lifetime_hours_required = self["lifetime kilometers"] * self.cycle_hours_per_km
 
-        # Guard against degenerate cycles
-        duty_km = xr.where(duty_km > 0, duty_km, np.nan)
-
-        # 4) Convert lifetime kilometers → required stack operating hours, including idle:
-        #    lifetime_hours_required = lifetime_km * (duration_h / duty_km)
-        lifetime_hours_required = self["lifetime kilometers"] * (duration_h / duty_km)
-
-        # 5) Stacks needed and replacements
+        # 2) Stacks needed and replacements
         fc_life_h = _(self["fuel cell lifetime hours"])
         stacks_needed = lifetime_hours_required / fc_life_h
 
-        replacements = xr.apply_ufunc(np.ceil, stacks_needed) - 1
+        replacements = np.ceil(stacks_needed)
+        replacements -= 1
         replacements = replacements.clip(min=0, max=5)
 
         if self["fuel cell lifetime replacements"].sum() == 0:
@@ -579,7 +586,7 @@ class TruckModel(VehicleModel):
         """
 
         _ = lambda x: np.where(x == 0, 1, x)
-        _nz = lambda x: np.where(x < 1, 1, x)
+        _nz = lambda x: np.maximum(x, 1)
 
         self.set_average_lhv()
 
@@ -601,7 +608,7 @@ class TruckModel(VehicleModel):
             )
 
             self.array.loc[dict(powertrain="ICEV-g", parameter="fuel tank mass")] = (
-                (0.018 * np.power(57.6, 2)) - (0.6011 * 57.6) + 52.235
+                (0.018 * 57.6 * 57.6) - (0.6011 * 57.6) + 52.235
             ) * nb_cylinder
 
         for pt in [
@@ -637,15 +644,7 @@ class TruckModel(VehicleModel):
             )
 
             self.array.loc[dict(powertrain="FCEV", parameter="fuel tank mass")] = (
-                (
-                    -0.1916
-                    * np.power(
-                        14.4,
-                        2,
-                    )
-                )
-                + (14.586 * 14.4)
-                + 10.805
+                (-0.1916 * 14.4 * 14.4) + (14.586 * 14.4) + 10.805
             ) * nb_cylinder
 
         self["oxidation energy stored"] = (
@@ -712,9 +711,7 @@ class TruckModel(VehicleModel):
         """
 
         # Capital recovery factor (handle i==0 gracefully)
-        i = infra_wacc
-        N = charger_life_years
-        CRF = xr.where(i == 0, 1.0 / N, i * (1 + i) ** N / ((1 + i) ** N - 1))
+        CRF = _crf(infra_wacc, charger_life_years)
 
         # Upfront per charger (€/kW * kW)
         upfront_per_charger = charger_power_kw * (
@@ -746,8 +743,6 @@ class TruckModel(VehicleModel):
         return xr.where(np.isfinite(surcharge_per_kWh), surcharge_per_kWh, 0.0)
 
     def set_costs(self):
-        _nz = lambda x: np.where(x < 1, 1, x)
-
         glider_components = [
             "glider base mass",
             "suspension mass",
@@ -792,18 +787,15 @@ class TruckModel(VehicleModel):
         self["fuel tank cost"] = self["fuel tank cost per kg"] * self["fuel mass"]
 
         # Per vkm
-        self["energy cost"] = (
-            (
-                self["energy cost per kWh (depot)"]
-                * self["share depot charging"]
-                * self["TtW energy"]
-            )
-            + (
-                self["energy cost per kWh (public)"]
-                * (1 - self["share depot charging"])
-                * self["TtW energy"]
-            )
-        ) / 3600
+        depot_price = self["energy cost per kWh (depot)"]
+        public_price = self["energy cost per kWh (public)"]
+        share_depot = self["share depot charging"]
+        ttw_energy = self["TtW energy"]
+
+        self["energy cost"] = ne.evaluate(
+            "((depot_price * share_depot * ttw_energy)"
+            " + (public_price * (1 - share_depot) * ttw_energy)) / 3600"
+        )
 
         # For BEVs, need to divide cost of electricity in battery by efficiency of charging
         for pt in [
@@ -1034,15 +1026,24 @@ class TruckModel(VehicleModel):
         ]
 
         response = xr.DataArray(
-            np.zeros(
-                (
-                    len(scope["size"]),
-                    len(scope["powertrain"]),
-                    len(list_cost_cat),
-                    len(scope["year"]),
-                    len(self.array.coords["value"].values),
-                )
-            ),
+            self.array.sel(
+                powertrain=scope["powertrain"],
+                size=scope["size"],
+                year=scope["year"],
+                parameter=[
+                    "amortised purchase cost",
+                    "maintenance cost",
+                    "insurance cost",
+                    "toll cost",
+                    "CO2 tax cost",
+                    "energy infrastructure cost",
+                    "amortised component replacement cost",
+                    "energy cost",
+                    "amortised residual credit",
+                ],
+            )
+            .transpose("size", "powertrain", "parameter", "year", "value")
+            .values.astype(np.float64),
             coords=[
                 scope["size"],
                 scope["powertrain"],
@@ -1053,23 +1054,6 @@ class TruckModel(VehicleModel):
             dims=["size", "powertrain", "cost_type", "year", "value"],
         )
 
-        response.loc[:, :, list_cost_cat, :, :] = self.array.sel(
-            powertrain=scope["powertrain"],
-            size=scope["size"],
-            year=scope["year"],
-            parameter=[
-                "amortised purchase cost",
-                "maintenance cost",
-                "insurance cost",
-                "toll cost",
-                "CO2 tax cost",
-                "energy infrastructure cost",
-                "amortised component replacement cost",
-                "energy cost",
-                "amortised residual credit",
-            ],
-        ).values
-
         if not sensitivity:
             return response * (self.array.sel(parameter="cargo mass") > 100)
         else:
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 from carculator_utils.array import fill_xarray_from_input_parameters
 
-from carculator_truck import TruckInputParameters, TruckModel
+from carculator_truck import TruckInputParameters, TruckModel, get_driving_cycle
 
 tip = TruckInputParameters()
 tip.static()
@@ -143,6 +143,54 @@ tm = TruckModel(arr)
 tm.set_all()
 
 
+def test_custom_cycle_several_sizes():
+    # A custom driving cycle is shared by all sizes
+    _, arr = fill_xarray_from_input_parameters(
+        tip, scope={"size": ["18t", "40t"], "powertrain": ["ICEV-d", "FCEV"]}
+    )
+    cycle = get_driving_cycle(["40t"], "Urban delivery").flatten()
+    tm_custom = TruckModel(arr, cycle=cycle, country="CH")
+    tm_custom.set_all()
+
+    distance = np.nansum(cycle) / 3.6 / 1000
+    assert np.allclose(tm_custom.cycle_distance, [distance, distance])
+    assert np.all(tm_custom["TtW energy"].sel(powertrain="ICEV-d") > 0)
+
+    # Fuel cell stacks needed over the lifetime, given the hours of
+    # operation per km of the custom cycle
+    fcev = tm_custom.array.sel(powertrain="FCEV")
+    hours_per_km = len(cycle) / 3600 / distance
+    stacks = (
+        fcev.sel(parameter="lifetime kilometers")
+        * hours_per_km
+        / fcev.sel(parameter="fuel cell lifetime hours")
+    )
+    assert np.allclose(tm_custom.cycle_hours_per_km, [hours_per_km, hours_per_km])
+    assert np.array_equal(
+        fcev.sel(parameter="fuel cell lifetime replacements"),
+        np.clip(np.ceil(stacks) - 1, 0, 5),
+    )
+
+
+def test_driving_cycle_cache():
+    # Modifying a returned driving cycle must not affect later calls
+    dc = get_driving_cycle(["18t", "40t"], "Urban delivery")
+    ref = dc.copy()
+    dc[:] = 0
+
+    assert np.array_equal(
+        get_driving_cycle(["18t", "40t"], "Urban delivery"), ref, equal_nan=True
+    )
+
+    # A single size can be passed as a string
+    assert np.array_equal(
+        get_driving_cycle("18t", "Urban delivery"),
+        get_driving_cycle(["18t"], "Urban delivery"),
+        equal_nan=True,
+    )
+    assert get_driving_cycle("18t", "Urban delivery").shape[1] == 1
+
+
 def test_model_results():
     list_powertrains = [
         "ICEV-d",